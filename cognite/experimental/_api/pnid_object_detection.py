@@ -1,19 +1,61 @@
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
+from cognite.client.exceptions import CogniteAPIError
 from cognite.experimental._context_client import ContextAPI
 from cognite.experimental.data_classes import ContextualizationJob
 
 
 class PNIDObjectDetectionAPI(ContextAPI):
     _RESOURCE_PATH = "/context/pnidobjects"
+    _JOB_CACHE_SIZE = 128
+    _REUSABLE_STATUSES = {"Queued", "Running", "Completed"}
 
-    def find_objects(self, file_id: int) -> ContextualizationJob:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._job_cache: "OrderedDict[int, ContextualizationJob]" = OrderedDict()
+
+    def find_objects(self, file_id: int, reuse_job: bool = False) -> ContextualizationJob:
         """Find objects in a PnID
 
         Args:
             file_id (int): ID of the file, should already be uploaded in the same tenant.
+            reuse_job (bool): Return the job previously queued for this file if it is still queued, running or completed, instead of queueing a new one.
+                Its status is refreshed first, so failed or expired jobs are never reused. Do not use if the file content may have changed.
 
         Returns:
             ContextualizationJob: Resulting queued job. Note that .results property of this job will block waiting for results.
         """
-        return self._run_job(job_path="/findobjects", status_path="/", file_id=file_id,)
+        if not reuse_job:
+            return self._run_job(job_path="/findobjects", status_path="/", file_id=file_id,)
+        job = self._reusable_job(file_id)
+        if job is None:
+            job = self._run_job(job_path="/findobjects", status_path="/", file_id=file_id,)
+            self._job_cache[file_id] = job
+            if len(self._job_cache) > self._JOB_CACHE_SIZE:
+                self._job_cache.popitem(last=False)
+        return job
+
+    def invalidate(self, file_id: int) -> None:
+        """Forget the job cached for a file, so the next find_objects call with `reuse_job=True` queues a new job.
+
+        Args:
+            file_id (int): ID of the file.
+        """
+        self._job_cache.pop(file_id, None)
+
+    def _reusable_job(self, file_id: int) -> Optional[ContextualizationJob]:
+        job = self._job_cache.get(file_id)
+        if job is None:
+            return None
+        try:
+            status = job.update_status()
+        except CogniteAPIError as e:
+            if e.code not in (400, 404):
+                raise
+            status = None  # job no longer retrievable, e.g. its results expired
+        if status not in self._REUSABLE_STATUSES:
+            self.invalidate(file_id)
+            return None
+        self._job_cache.move_to_end(file_id)
+        return job
@@ -2,6 +2,7 @@ import re
 
 import pytest
 
+from cognite.client.exceptions import CogniteAPIError
 from cognite.experimental import CogniteClient
 from cognite.experimental.data_classes import ContextualizationJob
 from cognite.experimental.exceptions import ModelFailedException
@@ -11,6 +12,13 @@ COGNITE_CLIENT = CogniteClient()
 PNID_OBJECT_DETECTION_API = COGNITE_CLIENT.pnid_object_detection
 
 
+@pytest.fixture(autouse=True)
+def clear_job_cache():
+    PNID_OBJECT_DETECTION_API._job_cache.clear()
+    yield
+    PNID_OBJECT_DETECTION_API._job_cache.clear()
+
+
 @pytest.fixture
 def mock_find_objects(rsps):
     response_body = {"jobId": 789, "status": "Queued"}
@@ -78,3 +86,65 @@ class TestPNIDObjectDetection:
                 assert "/789" in call.request.url
         assert 1 == n_find_objects_calls
         assert 1 == n_status_calls
+
+    def test_find_objects_not_reused_by_default(self, mock_find_objects):
+        job = PNID_OBJECT_DETECTION_API.find_objects(123)
+        assert job is not PNID_OBJECT_DETECTION_API.find_objects(123)
+        assert 2 == len(mock_find_objects.calls)
+        assert 0 == len(PNID_OBJECT_DETECTION_API._job_cache)
+
+    def test_find_objects_reuse_job(self, mock_find_objects, mock_status_find_objects_ok):
+        job = PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert job is PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert ["POST", "GET"] == [call.request.method for call in mock_find_objects.calls]
+        assert "Completed" == job.status
+
+        PNID_OBJECT_DETECTION_API.invalidate(123)
+        assert job is not PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert ["POST", "GET", "POST"] == [call.request.method for call in mock_find_objects.calls]
+
+    def test_find_objects_failed_job_not_reused(self, mock_find_objects, mock_status_failed):
+        job = PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert "Queued" == job.status
+        new_job = PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert job is not new_job
+        assert "Failed" == job.status
+        assert ["POST", "GET", "POST"] == [call.request.method for call in mock_find_objects.calls]
+
+    @pytest.mark.parametrize("status", [400, 404])
+    def test_find_objects_expired_job_not_reused(self, mock_find_objects, status):
+        mock_find_objects.add(
+            mock_find_objects.GET,
+            re.compile(
+                PNID_OBJECT_DETECTION_API._get_base_url_with_base_path()
+                + PNID_OBJECT_DETECTION_API._RESOURCE_PATH
+                + "/\\d+"
+            ),
+            status=status,
+            json={"error": {"code": status, "message": "Job not found"}},
+        )
+        job = PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert job is not PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert ["POST", "GET", "POST"] == [call.request.method for call in mock_find_objects.calls]
+
+    def test_find_objects_status_error_raised(self, mock_find_objects):
+        mock_find_objects.add(
+            mock_find_objects.GET,
+            re.compile(
+                PNID_OBJECT_DETECTION_API._get_base_url_with_base_path()
+                + PNID_OBJECT_DETECTION_API._RESOURCE_PATH
+                + "/\\d+"
+            ),
+            status=403,
+            json={"error": {"code": 403, "message": "Forbidden"}},
+        )
+        PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        with pytest.raises(CogniteAPIError):
+            PNID_OBJECT_DETECTION_API.find_objects(123, reuse_job=True)
+        assert ["POST", "GET"] == [call.request.method for call in mock_find_objects.calls]
+
+    def test_find_objects_job_cache_bounded(self, mock_find_objects, monkeypatch):
+        monkeypatch.setattr(PNID_OBJECT_DETECTION_API, "_JOB_CACHE_SIZE", 2)
+        for file_id in [1, 2, 3]:
+            PNID_OBJECT_DETECTION_API.find_objects(file_id, reuse_job=True)
+        assert [2, 3] == list(PNID_OBJECT_DETECTION_API._job_cache)